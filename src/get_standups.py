@@ -4,18 +4,185 @@ Notion Standup Script
 Fetches all pages with status = "Done" from a Notion database and saves to JSON file.
 """
 
+import asyncio
 import os
 import json
-import requests
+import sqlite3
+import time
+import httpx
+import ijson
+import logging
 import sys
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
+from tqdm.asyncio import tqdm_asyncio
 from utils import get_env_or_throw
 
+# orjson serializes several times faster than stdlib json; fall back if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
+
+def _parse_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class _ResponseStream:
+    """Minimal file-like wrapper exposing read() over an httpx byte stream."""
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._iterator)
+            except StopIteration:
+                break
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _join_rich_text(rich_text: List[Dict[str, Any]]) -> str:
+    """Join the plain text of a rich_text array into a single string."""
+    return "".join(text.get("plain_text", "") for text in rich_text)
+
+
+def _handle_title(prop_data: Dict[str, Any]) -> str:
+    title_array = prop_data.get("title", [])
+    return title_array[0].get("plain_text", "") if title_array else ""
+
+
+def _handle_rich_text(prop_data: Dict[str, Any]) -> str:
+    return _join_rich_text(prop_data.get("rich_text", []))
+
+
+def _handle_select(prop_data: Dict[str, Any]) -> str:
+    select_obj = prop_data.get("select")
+    return select_obj.get("name", "") if select_obj else ""
+
+
+def _handle_multi_select(prop_data: Dict[str, Any]) -> List[str]:
+    return [item.get("name", "") for item in prop_data.get("multi_select", [])]
+
+
+def _handle_date(prop_data: Dict[str, Any]) -> str:
+    date_obj = prop_data.get("date")
+    return date_obj.get("start", "") if date_obj else ""
+
+
+# Property extractors looked up by property type instead of an if/elif ladder
+PROP_HANDLERS = {
+    "title": _handle_title,
+    "rich_text": _handle_rich_text,
+    "select": _handle_select,
+    "multi_select": _handle_multi_select,
+    "date": _handle_date,
+    "checkbox": lambda prop_data: prop_data.get("checkbox", False),
+    "number": lambda prop_data: prop_data.get("number"),
+    "url": lambda prop_data: prop_data.get("url", ""),
+    "email": lambda prop_data: prop_data.get("email", ""),
+    "phone_number": lambda prop_data: prop_data.get("phone_number", ""),
+}
+
+
+# Block types whose text is kept when building standup contents
+ALLOWED_TYPES = frozenset({
+    "to_do", "bulleted_list_item", "numbered_list_item", "paragraph",
+    "heading_1", "heading_2", "heading_3"
+})
+
+
+# Transient statuses retried with backoff; the httpx transport retries
+# cover connection failures only, never HTTP status codes
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring Retry-After when sent."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return BACKOFF_FACTOR * (2 ** attempt)
+
+
+def _extract_text(block: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Extract just (block_type, text) from a block, skipping the metadata
+    dict that extract_block_content builds.
+
+    Args:
+        block: Block object from Notion API
+
+    Returns:
+        Tuple of (block_type, text); text is empty when the block has none
+    """
+    block_type = block.get("type", "unknown")
+    block_data = block.get(block_type, {})
+    if isinstance(block_data, dict):
+        rich_text = block_data.get("rich_text")
+        if rich_text:
+            return block_type, _join_rich_text(rich_text)
+    return block_type, ""
+
+
+# Extra fields a few block types carry on top of the shared rich_text content
+SPECIAL_BLOCK_FIELDS = {
+    "to_do": lambda block_data: {"checked": block_data.get("checked", False)},
+    "code": lambda block_data: {"language": block_data.get("language", "")},
+    "callout": lambda block_data: {"icon": block_data.get("icon", {})},
+}
+
+
+class TokenBucketRateLimiter:
+    """Token-bucket rate limiter shared by all concurrent Notion requests."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Tokens added per second (sustained requests/second)
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 
 class NotionStandup:
     def __init__(self, notion_token: str, database_id: str):
@@ -35,6 +202,93 @@ class NotionStandup:
             "Notion-Version": "2022-06-28"
         }
 
+        # Precomputed endpoint URLs so hot paths skip per-call string formatting
+        self._db_url = f"{self.base_url}/databases/{self.database_id}"
+        self._db_query_url = f"{self._db_url}/query"
+        self._blocks_url_prefix = f"{self.base_url}/blocks/"
+        self._pages_url_prefix = f"{self.base_url}/pages/"
+
+        # One HTTP/2 client so concurrent requests multiplex streams over a
+        # single TLS connection instead of opening one connection per request
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=5,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        )
+        self.client = httpx.Client(headers=self.headers, timeout=30.0, transport=transport)
+
+        # On-disk cache of extracted contents keyed by (page_id, last_edited_time),
+        # so pages that haven't changed since the last run skip the block fetch
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cache_dir = os.path.join(project_root, "logs")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache = sqlite3.connect(os.path.join(cache_dir, ".block_cache.sqlite"))
+        self.cache.execute(
+            "CREATE TABLE IF NOT EXISTS block_cache ("
+            "page_id TEXT, last_edited_time TEXT, contents TEXT, "
+            "PRIMARY KEY (page_id, last_edited_time))"
+        )
+
+        # Per-property handler plan built from the first page seen; the schema
+        # is fixed per database, so later pages skip the type dispatch entirely
+        self._property_plan = None
+
+        # Shared limiter and worker-slot semaphore for the async block
+        # fetching, created here so the async methods work without run()
+        self.rate_limiter = TokenBucketRateLimiter(rate=3, capacity=3)
+        self.page_semaphore = asyncio.Semaphore(5)
+
+    def close(self) -> None:
+        """Release the pooled connections and the cache held by the client."""
+        self.client.close()
+        self.cache.close()
+
+    def __enter__(self) -> "NotionStandup":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_with_retries(self, url: str, params: Dict[str, Any] = None) -> httpx.Response:
+        """
+        GET with retry and backoff on transient HTTP statuses (429/5xx).
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+
+        Returns:
+            The final response; callers still call raise_for_status on it
+        """
+        for attempt in range(MAX_RETRIES):
+            response = self.client.get(url, params=params)
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+            delay = _retry_delay(response, attempt)
+            log.warning("Got %d from %s, retrying in %.1fs", response.status_code, url, delay)
+            time.sleep(delay)
+        return self.client.get(url, params=params)
+
+    def get_projection_property_ids(self) -> List[str]:
+        """
+        Fetch the database schema once and return the property IDs of the
+        Name and Project properties, the only two the extraction reads.
+
+        Returns:
+            List of property IDs (empty if the schema lookup fails)
+        """
+        try:
+            response = self._get_with_retries(self._db_url)
+            response.raise_for_status()
+            properties = _parse_json(response.content).get("properties", {})
+            return [
+                prop.get("id") for name, prop in properties.items()
+                if name in ("Name", "Project") and prop.get("id")
+            ]
+        except httpx.HTTPError as e:
+            log.error("Error fetching database schema: %s", e)
+            return []
+
     def fetch_done_pages(self) -> List[Dict[str, Any]]:
         """
         Fetch all pages from the database with status = "Done".
@@ -48,41 +302,78 @@ class NotionStandup:
 
         print("Fetching pages with status = 'Done'...")
 
-        while has_more:
-            # Prepare the request body for filtering
-            request_body = {
-                "filter": {
-                    "property": "Status",
-                    "status": {
-                        "equals": "Done"
-                    }
+        # Project responses down to just the properties extraction needs,
+        # shrinking payload size and decode time for wide schemas
+        filter_properties = self.get_projection_property_ids()
+        params = {"filter_properties": filter_properties} if filter_properties else None
+
+        # Build the request body once; only the cursor changes between pages
+        request_body = {
+            "filter": {
+                "property": "Status",
+                "status": {
+                    "equals": "Done"
                 }
-            }
+            },
+            "page_size": 100
+        }
 
+        while has_more:
             if start_cursor:
                 request_body["start_cursor"] = start_cursor
+            else:
+                request_body.pop("start_cursor", None)
 
             try:
-                response = requests.post(
-                    f"{self.base_url}/databases/{self.database_id}/query",
-                    headers=self.headers,
-                    json=request_body
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                pages = data.get("results", [])
-                all_pages.extend(pages)
-
-                has_more = data.get("has_more", False)
-                start_cursor = data.get("next_cursor")
-
-                print(f"Fetched {len(pages)} pages (total: {len(all_pages)})")
-
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching pages: {e}")
+                for attempt in range(MAX_RETRIES + 1):
+                    with self.client.stream(
+                        "POST",
+                        self._db_query_url,
+                        params=params,
+                        json=request_body
+                    ) as response:
+                        # Transient statuses are retried with backoff; the
+                        # transport-level retries only cover connection failures
+                        if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                            delay = _retry_delay(response, attempt)
+                            log.warning("Got %d querying database, retrying in %.1fs",
+                                        response.status_code, delay)
+                        else:
+                            # Streamed responses have no body until read; load error
+                            # bodies here so the handler below can log response.text
+                            if response.status_code >= 400:
+                                response.read()
+                            response.raise_for_status()
+
+                            # Stream-parse the response so only one page dict is alive at a
+                            # time instead of materializing the full result list up front
+                            fetched = 0
+                            has_more = False
+                            start_cursor = None
+                            builder = None
+                            for prefix, event, value in ijson.parse(_ResponseStream(response.iter_bytes())):
+                                if prefix == "results.item" and event == "start_map":
+                                    builder = ijson.ObjectBuilder()
+                                    builder.event(event, value)
+                                elif builder is not None:
+                                    builder.event(event, value)
+                                    if prefix == "results.item" and event == "end_map":
+                                        all_pages.append(builder.value)
+                                        fetched += 1
+                                        builder = None
+                                elif prefix == "has_more":
+                                    has_more = value
+                                elif prefix == "next_cursor" and value:
+                                    start_cursor = value
+                            break
+                    time.sleep(delay)
+
+                log.debug("Fetched %d pages (total: %d)", fetched, len(all_pages))
+
+            except httpx.HTTPError as e:
+                log.error("Error fetching pages: %s", e)
                 if hasattr(e, 'response') and e.response is not None:
-                    print(f"Response: {e.response.text}")
+                    log.error("Response: %s", e.response.text)
                 sys.exit(1)
 
         return all_pages
@@ -98,18 +389,15 @@ class NotionStandup:
             Page details dictionary with content
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/pages/{page_id}",
-                headers=self.headers
-            )
+            response = self._get_with_retries(self._pages_url_prefix + page_id)
             response.raise_for_status()
-            page_data = response.json()
+            page_data = _parse_json(response.content)
 
             # Extract detailed properties and content
             return self.extract_page_details(page_data)
 
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching page details for {page_id}: {e}")
+        except httpx.HTTPError as e:
+            log.error("Error fetching page details for %s: %s", page_id, e)
             return {}
 
     def get_page_blocks(self, page_id: str) -> List[Dict[str, Any]]:
@@ -128,73 +416,136 @@ class NotionStandup:
 
         while has_more:
             try:
-                url = f"{self.base_url}/blocks/{page_id}/children"
-                params = {}
+                url = self._blocks_url_prefix + page_id + "/children"
+                params = {"page_size": 100}
                 if start_cursor:
                     params["start_cursor"] = start_cursor
 
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self._get_with_retries(url, params=params)
                 response.raise_for_status()
 
-                data = response.json()
+                data = _parse_json(response.content)
                 blocks = data.get("results", [])
                 all_blocks.extend(blocks)
 
                 has_more = data.get("has_more", False)
                 start_cursor = data.get("next_cursor")
 
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching blocks for page {page_id}: {e}")
+            except httpx.HTTPError as e:
+                log.error("Error fetching blocks for page %s: %s", page_id, e)
                 if hasattr(e, 'response') and e.response is not None:
-                    print(f"Response: {e.response.text}")
+                    log.error("Response: %s", e.response.text)
                 break
 
         return all_blocks
 
-    def get_all_blocks_recursive(self, page_id: str) -> List[Dict[str, Any]]:
+    async def _fetch_children(self, client: httpx.AsyncClient, block_id: str,
+                              start_cursor: str = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
-        Get all blocks from a page recursively, including all children.
+        Fetch one page of child blocks for a block.
 
         Args:
-            page_id: The ID of the page to fetch blocks for
+            client: Shared async HTTP/2 client
+            block_id: The ID of the block to fetch children for
+            start_cursor: Pagination cursor from the previous page, if any
 
         Returns:
-            List of all block objects in order
+            Tuple of (blocks, next_cursor); next_cursor is None on the last page
         """
-        all_blocks = []
-        has_more = True
-        start_cursor = None
+        url = self._blocks_url_prefix + block_id + "/children"
+        params = {"page_size": 100}
+        if start_cursor:
+            params["start_cursor"] = start_cursor
+
+        # Shared limiter keeps all workers under Notion's ~3 requests/second limit
+        await self.rate_limiter.acquire()
+        response = await client.get(url, params=params)
+
+        # The async client has no transport retries; retry transient statuses
+        # here so one 429/5xx doesn't silently empty a page's contents
+        for attempt in range(MAX_RETRIES):
+            if response.status_code not in RETRY_STATUS_CODES:
+                break
+            delay = _retry_delay(response, attempt)
+            log.warning("Got %d from %s, retrying in %.1fs", response.status_code, url, delay)
+            await asyncio.sleep(delay)
+            await self.rate_limiter.acquire()
+            response = await client.get(url, params=params)
 
-        while has_more:
-            try:
-                url = f"{self.base_url}/blocks/{page_id}/children"
-                params = {}
-                if start_cursor:
-                    params["start_cursor"] = start_cursor
+        response.raise_for_status()
+        data = _parse_json(response.content)
 
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
+        blocks = data.get("results", [])
+        next_cursor = data.get("next_cursor") if data.get("has_more", False) else None
+        return blocks, next_cursor
 
-                data = response.json()
-                blocks = data.get("results", [])
+    async def _fetch_all_children(self, client: httpx.AsyncClient,
+                                  block_id: str) -> List[Dict[str, Any]]:
+        """
+        Paginate through every child block of one block.
 
-                # Process each block and its children
-                for block in blocks:
-                    all_blocks.append(block)
+        Args:
+            client: Shared async HTTP/2 client
+            block_id: The ID of the block to fetch children for
 
-                    # If block has children, fetch them recursively
-                    if block.get("has_children", False):
-                        child_blocks = self.get_all_blocks_recursive(block.get("id"))
-                        all_blocks.extend(child_blocks)
+        Returns:
+            List of all direct child blocks in order
+        """
+        blocks = []
+        start_cursor = None
+        while True:
+            page_blocks, start_cursor = await self._fetch_children(client, block_id, start_cursor)
+            blocks.extend(page_blocks)
+            if not start_cursor:
+                break
+        return blocks
 
-                has_more = data.get("has_more", False)
-                start_cursor = data.get("next_cursor")
+    async def get_all_blocks_recursive(self, client: httpx.AsyncClient, page_id: str,
+                                       allowed_types: frozenset = None) -> List[Dict[str, Any]]:
+        """
+        Get all blocks from a page, including all children. The tree is
+        walked breadth-first: the children of every block on the current
+        level are fetched with one gather, then the collected tree is
+        flattened with an explicit stack to restore document order.
 
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching blocks for page {page_id}: {e}")
-                if hasattr(e, 'response') and e.response is not None:
-                    print(f"Response: {e.response.text}")
-                break
+        Args:
+            client: Shared async HTTP/2 client
+            page_id: The ID of the page to fetch blocks for
+            allowed_types: When given, children are only fetched for blocks
+                of these types, pruning subtrees the caller won't render
+
+        Returns:
+            List of all block objects in order
+
+        Raises:
+            httpx.HTTPError: If any block fetch fails; callers must not
+                treat a partial tree as the page's content (or cache it)
+        """
+        children: Dict[str, List[Dict[str, Any]]] = {}
+        frontier = [page_id]
+
+        while frontier:
+            results = await asyncio.gather(*[
+                self._fetch_all_children(client, block_id) for block_id in frontier
+            ])
+            next_frontier = []
+            for block_id, blocks in zip(frontier, results):
+                children[block_id] = blocks
+                next_frontier.extend(
+                    block.get("id") for block in blocks
+                    if block.get("has_children", False)
+                    and (allowed_types is None or block.get("type") in allowed_types)
+                )
+            frontier = next_frontier
+
+        # Flatten depth-first with an explicit stack to preserve document order
+        all_blocks = []
+        stack = list(reversed(children.get(page_id, [])))
+        while stack:
+            block = stack.pop()
+            all_blocks.append(block)
+            if block.get("has_children", False):
+                stack.extend(reversed(children.get(block.get("id"), [])))
 
         return all_blocks
 
@@ -223,119 +574,18 @@ class NotionStandup:
             "has_children": block.get("has_children", False)
         }
 
-        # Extract content based on block type
-        if block_type == "to_do":
-            to_do_data = block.get("to_do", {})
-            rich_text = to_do_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-            extracted["checked"] = to_do_data.get("checked", False)
-
-        elif block_type == "paragraph":
-            paragraph_data = block.get("paragraph", {})
-            rich_text = paragraph_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "heading_1":
-            heading_data = block.get("heading_1", {})
-            rich_text = heading_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "heading_2":
-            heading_data = block.get("heading_2", {})
-            rich_text = heading_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "heading_3":
-            heading_data = block.get("heading_3", {})
-            rich_text = heading_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "bulleted_list_item":
-            list_data = block.get("bulleted_list_item", {})
-            rich_text = list_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "numbered_list_item":
-            list_data = block.get("numbered_list_item", {})
-            rich_text = list_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "toggle":
-            toggle_data = block.get("toggle", {})
-            rich_text = toggle_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "quote":
-            quote_data = block.get("quote", {})
-            rich_text = quote_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-
-        elif block_type == "code":
-            code_data = block.get("code", {})
-            rich_text = code_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-            extracted["language"] = code_data.get("language", "")
-
-        elif block_type == "callout":
-            callout_data = block.get("callout", {})
-            rich_text = callout_data.get("rich_text", [])
-            content = "".join([text.get("plain_text", "") for text in rich_text])
-            extracted["content"] = content
-            extracted["icon"] = callout_data.get("icon", {})
-
-        else:
-            # For other block types, try to extract any rich_text content
-            for key, value in block.items():
-                if isinstance(value, dict) and "rich_text" in value:
-                    rich_text = value.get("rich_text", [])
-                    content = "".join([text.get("plain_text", "") for text in rich_text])
-                    if content:
-                        extracted["content"] = content
-                        break
-
-        return extracted
-
-    def extract_page_properties(self, page: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Extract only id, title, and projectName from a Notion page (for fetch_done_pages).
-
-        Args:
-            page: Raw page object from Notion API
-
-        Returns:
-            Dictionary with id, title, and projectName
-        """
-        properties = page.get("properties", {})
-        page_id = page.get("id")
-
-        # Extract only the 3 required fields
-        extracted = {
-            "id": page_id,
-            "title": "",
-            "projectName": ""
-        }
-
-        # Extract title from Name property
-        name_prop = properties.get("Name", {})
-        if name_prop.get("type") == "title":
-            title_array = name_prop.get("title", [])
-            extracted["title"] = title_array[0].get("plain_text", "") if title_array else ""
+        # Every text-bearing block type keeps its text under <type>.rich_text,
+        # so one generic join covers what used to be per-type branches
+        block_data = block.get(block_type, {})
+        if isinstance(block_data, dict):
+            rich_text = block_data.get("rich_text")
+            if rich_text:
+                extracted["content"] = _join_rich_text(rich_text)
 
-        # Extract project name from Project property
-        project_prop = properties.get("Project", {})
-        if project_prop.get("type") == "select":
-            select_obj = project_prop.get("select")
-            extracted["projectName"] = select_obj.get("name", "") if select_obj else ""
+            # A few block types carry extra fields beyond their text
+            special = SPECIAL_BLOCK_FIELDS.get(block_type)
+            if special:
+                extracted.update(special(block_data))
 
         return extracted
 
@@ -365,64 +615,58 @@ class NotionStandup:
 
         # Fetch and extract block content
         if page_id:
-            print(f"  Fetching blocks for page {page_id}...")
+            log.debug("Fetching blocks for page %s...", page_id)
             blocks = self.get_page_blocks(page_id)
             for block in blocks:
                 block_content = self.extract_block_content(block)
                 if block_content["content"]:  # Only include blocks with content
                     extracted["content"].append(block_content)
 
-        # Extract specific properties based on common field names
-        for prop_name, prop_data in properties.items():
-            prop_type = prop_data.get("type")
-
-            if prop_type == "title":
-                title_array = prop_data.get("title", [])
-                extracted["properties"][prop_name] = title_array[0].get("plain_text", "") if title_array else ""
-
-            elif prop_type == "rich_text":
-                rich_text_array = prop_data.get("rich_text", [])
-                extracted["properties"][prop_name] = "".join([text.get("plain_text", "") for text in rich_text_array])
-
-            elif prop_type == "select":
-                select_obj = prop_data.get("select")
-                extracted["properties"][prop_name] = select_obj.get("name", "") if select_obj else ""
-
-            elif prop_type == "multi_select":
-                multi_select_array = prop_data.get("multi_select", [])
-                extracted["properties"][prop_name] = [item.get("name", "") for item in multi_select_array]
-
-            elif prop_type == "date":
-                date_obj = prop_data.get("date")
-                extracted["properties"][prop_name] = date_obj.get("start", "") if date_obj else ""
-
-            elif prop_type == "checkbox":
-                extracted["properties"][prop_name] = prop_data.get("checkbox", False)
-
-            elif prop_type == "number":
-                extracted["properties"][prop_name] = prop_data.get("number")
+        # Specialize dispatch to this database's schema: the first page builds
+        # a plan mapping property name to handler, later pages reuse it
+        plan = self._property_plan
+        if plan is None:
+            plan = self._property_plan = {
+                prop_name: PROP_HANDLERS.get(prop_data.get("type"))
+                for prop_name, prop_data in properties.items()
+            }
 
-            elif prop_type == "url":
-                extracted["properties"][prop_name] = prop_data.get("url", "")
+        # Extract specific properties via the plan; unknown types keep raw data
+        for prop_name, prop_data in properties.items():
+            try:
+                handler = plan[prop_name]
+            except KeyError:
+                # Property missing from the sampled schema; fall back to
+                # generic type dispatch without invalidating the plan
+                handler = PROP_HANDLERS.get(prop_data.get("type"))
+            extracted["properties"][prop_name] = handler(prop_data) if handler else prop_data
 
-            elif prop_type == "email":
-                extracted["properties"][prop_name] = prop_data.get("email", "")
+        return extracted
 
-            elif prop_type == "phone_number":
-                extracted["properties"][prop_name] = prop_data.get("phone_number", "")
+    async def _extract_page(self, client: httpx.AsyncClient,
+                            page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract one page's content while holding a worker slot, so only a
+        bounded number of pages are processed concurrently.
 
-            else:
-                # For other types, store the raw data
-                extracted["properties"][prop_name] = prop_data
+        Args:
+            client: Shared async HTTP/2 client
+            page: Raw page object from Notion API
 
-        return extracted
+        Returns:
+            Dictionary with id, title, projectName, and contents
+        """
+        async with self.page_semaphore:
+            return await self.extract_simple_content(client, page)
 
-    def extract_simple_content(self, page: Dict[str, Any]) -> Dict[str, Any]:
+    async def extract_simple_content(self, client: httpx.AsyncClient,
+                                     page: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract id, title, projectName, and contents (checkbox, bullet points, normal text only).
         All contents for a page are combined into a single line separated by periods.
 
         Args:
+            client: Shared async HTTP/2 client
             page: Raw page object from Notion API
 
         Returns:
@@ -442,14 +686,24 @@ class NotionStandup:
         # Extract title from Name property
         name_prop = properties.get("Name", {})
         if name_prop.get("type") == "title":
-            title_array = name_prop.get("title", [])
-            extracted["title"] = title_array[0].get("plain_text", "") if title_array else ""
+            extracted["title"] = _handle_title(name_prop)
 
         # Extract project name from Project property
         project_prop = properties.get("Project", {})
         if project_prop.get("type") == "select":
-            select_obj = project_prop.get("select")
-            extracted["projectName"] = select_obj.get("name", "") if select_obj else ""
+            extracted["projectName"] = _handle_select(project_prop)
+
+        # Reuse cached contents when the page hasn't changed since the last run
+        last_edited_time = page.get("last_edited_time", "")
+        if page_id and last_edited_time:
+            row = self.cache.execute(
+                "SELECT contents FROM block_cache WHERE page_id = ? AND last_edited_time = ?",
+                (page_id, last_edited_time)
+            ).fetchone()
+            if row:
+                log.debug("Using cached content for page %s", page_id)
+                extracted["contents"] = json.loads(row[0])
+                return extracted
 
         # Collect all content pieces for this page
         content_pieces = []
@@ -459,26 +713,38 @@ class NotionStandup:
             content_pieces.append(extracted["title"])
 
         # Fetch and extract only specific content types recursively
+        fetch_complete = True
         if page_id:
-            print(f"  Fetching content for page {page_id}...")
-            blocks = self.get_all_blocks_recursive(page_id)
-            for block in blocks:
-                block_content = self.extract_block_content(block)
-                content = block_content.get("content", "")
-                block_type = block_content.get("type", "")
-
-                if not content:
-                    continue
-
-                # Add all content types to content pieces
-                if block_type in ["to_do", "bulleted_list_item", "numbered_list_item", "paragraph", "heading_1", "heading_2", "heading_3"]:
-                    content_pieces.append(content)
+            log.debug("Fetching content for page %s...", page_id)
+            try:
+                blocks = await self.get_all_blocks_recursive(client, page_id, ALLOWED_TYPES)
+            except httpx.HTTPError as e:
+                log.error("Error fetching blocks for page %s: %s", page_id, e)
+                blocks = []
+                fetch_complete = False
+            content_pieces.extend(
+                text for block_type, text in map(_extract_text, blocks)
+                if text and block_type in ALLOWED_TYPES
+            )
 
         # Combine all content pieces into a single line separated by periods
         if content_pieces:
             combined_content = ". ".join(content_pieces)
             extracted["contents"].append(combined_content)
 
+        # Cache only fully-fetched contents (a partial fetch would be served
+        # forever), dropping rows from earlier edits of the same page
+        if fetch_complete and page_id and last_edited_time:
+            self.cache.execute(
+                "DELETE FROM block_cache WHERE page_id = ? AND last_edited_time != ?",
+                (page_id, last_edited_time)
+            )
+            self.cache.execute(
+                "INSERT OR REPLACE INTO block_cache (page_id, last_edited_time, contents) VALUES (?, ?, ?)",
+                (page_id, last_edited_time, json.dumps(extracted["contents"], ensure_ascii=False))
+            )
+            self.cache.commit()
+
         return extracted
 
     def save_to_json(self, pages: List[Dict[str, Any]]) -> str:
@@ -501,8 +767,12 @@ class NotionStandup:
         os.makedirs(output_dir, exist_ok=True)
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(pages, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(pages, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(pages, f, indent=2, ensure_ascii=False)
 
             print(f"Successfully saved {len(pages)} pages to {filepath}")
             return filepath
@@ -539,7 +809,7 @@ class NotionStandup:
         # Convert merged dict back to a list
         return list(merged.values())
 
-    def run(self) -> str:
+    async def run(self) -> str:
         """
         Main method to fetch done pages and save to JSON.
 
@@ -558,12 +828,13 @@ class NotionStandup:
 
         print(f"Processing {len(raw_pages)} pages...")
 
-        # Extract properties and content from each page
-        processed_pages = []
-        for i, page in enumerate(raw_pages, 1):
-            print(f"Processing page {i}/{len(raw_pages)}: {page.get('id', 'unknown')}")
-            extracted_page = self.extract_simple_content(page)
-            processed_pages.append(extracted_page)
+        # Extract properties and content with a pool of 5 concurrent page workers
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        async with httpx.AsyncClient(http2=True, headers=self.headers,
+                                     timeout=30.0, limits=limits) as client:
+            processed_pages = await tqdm_asyncio.gather(*[
+                self._extract_page(client, page) for page in raw_pages
+            ], desc="pages")
 
         # Merge by projectName
         merged_pages = self.merge_by_project(processed_pages)
@@ -574,15 +845,16 @@ class NotionStandup:
 
 def main():
     """Main function to run the script using environment variables."""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
     # Get credentials from environment variables
     notion_token = get_env_or_throw("NOTION_TOKEN")
     database_id = get_env_or_throw("NOTION_DATABASE_ID")
 
     # Create and run the Notion client
-    client = NotionStandup(notion_token, database_id)
-
     try:
-        output_file = client.run()
+        with NotionStandup(notion_token, database_id) as client:
+            output_file = asyncio.run(client.run())
         print(f"\nScript completed successfully!")
         print(f"Output saved to: {output_file}")
 
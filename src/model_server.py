@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Standup Model Server
+Long-lived service that keeps the summarization model loaded so repeated
+script runs skip the multi-second model load and warmup.
+"""
+
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+from dotenv import load_dotenv
+
+from summarize_standups import build_input_text, setup_local_model, summarize_with_model
+
+# Load environment variables
+load_dotenv()
+
+app = FastAPI(title="Standup Model Server")
+
+# Model state loaded once at startup and shared across requests
+_state: Dict[str, Any] = {}
+
+class StandupItem(BaseModel):
+    """One standup entry to summarize."""
+
+    projectName: str = "Unknown Project"
+    contents: List[str] = []
+
+@app.on_event("startup")
+def load_model() -> None:
+    """Load the model and prefill the shared prompt prefix once."""
+    print("Loading model...")
+    model, tokenizer, prefix_ids, prefix_kv = setup_local_model()
+    _state.update(model=model, tokenizer=tokenizer,
+                  prefix_ids=prefix_ids, prefix_kv=prefix_kv)
+    print("Model ready")
+
+@app.post("/summarize")
+def summarize(standups: List[StandupItem]) -> List[str]:
+    """
+    Summarize a batch of standups with the resident model.
+
+    Args:
+        standups: List of standup entries
+
+    Returns:
+        One summary string per entry, in input order
+    """
+    summaries = []
+    for standup in standups:
+        input_text = build_input_text(standup.projectName, standup.contents)
+        summaries.append(summarize_with_model(
+            _state["model"], _state["tokenizer"],
+            _state["prefix_ids"], _state["prefix_kv"], input_text))
+    return summaries
+
+def main():
+    """Run the model server."""
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=8787)
+
+if __name__ == "__main__":
+    main()
@@ -4,28 +4,24 @@ Standup Prompt Generator
 Generates prompts for AI summarization of standup data.
 """
 
-import json
-import os
 import sys
+from pathlib import Path
 from typing import Dict, List, Any
 from dotenv import load_dotenv
-from utils import get_env_or_throw
-import pyperclip
+from utils import get_env_or_throw, load_standups
 
 # Load environment variables
 load_dotenv()
 
-class StandupPromptGenerator:
-    """Class to generate prompts for standup summarization."""
-
-    def get_initial_prompt(self) -> str:
-        """
-        Get the initial prompt for standup summarization.
+# Project root (parent of src/) and the standard log-file locations,
+# resolved once at import instead of per run in main()
+_ROOT = Path(__file__).resolve().parent.parent
+INPUT_FILE = _ROOT / "logs" / "standups.json"
+OUTPUT_FILE = _ROOT / "logs" / "standup-prompt.txt"
 
-        Returns:
-            Initial prompt string
-        """
-        return """
+# Prompt text is constant, so build the strings once at import time
+# instead of re-materializing the literals on every call
+_INITIAL_PROMPT = """
 Complete the following work items into proper sentences.
 Keep ticket numbers at the beginning.
 Do not add extra details.
@@ -36,14 +32,7 @@ Each bullet point should start with a dash (-)
 
 Now summarize the following standup data:"""
 
-    def get_response_format_prompt(self) -> str:
-        """
-        Get the response format instructions.
-
-        Returns:
-            Response format prompt string
-        """
-        return """
+_RESPONSE_FORMAT = """
 
 Response Format:
 The response should be in text with bullet points organized by project.
@@ -69,6 +58,30 @@ Gigworks
 - Added comprehensive filtering mechanism for data tables
 - Conducted thorough testing of new feature implementation"""
 
+# Precomputed prefix for per-standup prompt assembly
+_PROMPT_PREFIX = _INITIAL_PROMPT + "\n\n"
+
+class StandupPromptGenerator:
+    """Class to generate prompts for standup summarization."""
+
+    def get_initial_prompt(self) -> str:
+        """
+        Get the initial prompt for standup summarization.
+
+        Returns:
+            Initial prompt string
+        """
+        return _INITIAL_PROMPT
+
+    def get_response_format_prompt(self) -> str:
+        """
+        Get the response format instructions.
+
+        Returns:
+            Response format prompt string
+        """
+        return _RESPONSE_FORMAT
+
     def format_standup_data(self, standups: List[Dict[str, Any]]) -> str:
         """
         Format standup data for the prompt.
@@ -79,17 +92,24 @@ Gigworks
         Returns:
             Formatted string with standup data
         """
-        formatted_data = []
+        # Build one flat list of fragments and join once, instead of
+        # per-project strings assembled with repeated + concatenation
+        parts = []
 
         for standup in standups:
             project_name = standup.get('projectName', 'Unknown Project')
             contents = standup.get('contents', [])
 
-            project_data = f"Project: {project_name}\nWork completed:\n"
-            project_data += "\n".join([f"- {item}" for item in contents])
-            formatted_data.append(project_data)
+            if parts:
+                parts.append("\n\n---\n\n")
+            parts.append("Project: ")
+            parts.append(project_name)
+            parts.append("\nWork completed:\n")
+            if contents:
+                parts.append("- ")
+                parts.append("\n- ".join(contents))
 
-        return "\n\n---\n\n".join(formatted_data)
+        return "".join(parts)
 
     def generate_prompt(self, standups: List[Dict[str, Any]]) -> str:
         """
@@ -101,19 +121,14 @@ Gigworks
         Returns:
             Complete prompt string
         """
-        # Get initial prompt
-        initial_prompt = self.get_initial_prompt()
-
-        # Format standup data
-        formatted_data = self.format_standup_data(standups)
-
-        # Get response format
-        response_format = self.get_response_format_prompt()
-
-        # Combine all parts
-        complete_prompt = f"{initial_prompt}\n\n{formatted_data}\n{response_format}"
-
-        return complete_prompt
+        # Combine all parts with a single join
+        return "".join([
+            self.get_initial_prompt(),
+            "\n\n",
+            self.format_standup_data(standups),
+            "\n",
+            self.get_response_format_prompt()
+        ])
 
     def load_standups(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -125,15 +140,7 @@ Gigworks
         Returns:
             List of standup dictionaries
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Error: File {file_path} not found")
-            sys.exit(1)
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in {file_path}: {e}")
-            sys.exit(1)
+        return load_standups(file_path)
 
     def save_prompt(self, prompt: str, output_path: str) -> None:
         """
@@ -144,11 +151,10 @@ Gigworks
             output_path: Path to save the prompt file
         """
         try:
-            # Create output directory if it doesn't exist
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(prompt)
+            # Create output directory if it doesn't exist, then write in one shot
+            output_file = Path(output_path)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            output_file.write_text(prompt, encoding='utf-8')
 
             print(f"Prompt saved to {output_path}")
 
@@ -164,6 +170,10 @@ Gigworks
             text: The text to copy to clipboard
         """
         try:
+            # Imported here so the prompt path stays clipboard-free; repeat
+            # imports are a cached sys.modules lookup
+            import pyperclip
+
             pyperclip.copy(text)
             print("✓ Copied to clipboard")
         except Exception as e:
@@ -171,15 +181,10 @@ Gigworks
 
 def main():
     """Main function to generate and save the prompt."""
-    # Get project root directory (parent of src/)
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    input_file = os.path.join(project_root, "logs", "standups.json")
-    output_file = os.path.join(project_root, "logs", "standup-prompt.txt")
-
     # Load standup data
     generator = StandupPromptGenerator()
-    print(f"Loading standups from {input_file}...")
-    standups = generator.load_standups(input_file)
+    print(f"Loading standups from {INPUT_FILE}...")
+    standups = generator.load_standups(INPUT_FILE)
     print(f"Loaded {len(standups)} standups")
 
     # Generate prompt
@@ -188,13 +193,13 @@ def main():
 
     # Save prompt
     print("Saving prompt...")
-    generator.save_prompt(complete_prompt, output_file)
+    generator.save_prompt(complete_prompt, OUTPUT_FILE)
 
     print("\n=== GENERATED PROMPT ===")
     print(complete_prompt)
     print("=== END PROMPT ===")
 
-    print(f"\nPrompt saved to {output_file}")
+    print(f"\nPrompt saved to {OUTPUT_FILE}")
 
     # Copy to clipboard
     generator.copy_to_clipboard(complete_prompt)
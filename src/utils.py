@@ -3,8 +3,16 @@
 Common utility functions for the Notion standup scripts.
 """
 
+import json
 import os
 import sys
+from typing import Any, Dict, List
+
+# orjson decodes several times faster than stdlib json; fall back if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def get_env_or_throw(env_var: str) -> str:
@@ -25,3 +33,25 @@ def get_env_or_throw(env_var: str) -> str:
         print(f"Error: {env_var} environment variable is required")
         sys.exit(1)
     return value
+
+
+def load_standups(file_path) -> List[Dict[str, Any]]:
+    """
+    Load standup data from JSON file.
+
+    Args:
+        file_path: Path to the standups JSON file
+
+    Returns:
+        List of standup dictionaries
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except FileNotFoundError:
+        print(f"Error: File {file_path} not found")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: Invalid JSON in {file_path}: {e}")
+        sys.exit(1)